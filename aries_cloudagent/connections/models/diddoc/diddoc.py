@@ -40,6 +40,8 @@ class DIDDoc:
 
     CONTEXT = "https://w3id.org/did/v1"
 
+    __slots__ = ("_did", "_pubkey", "_service")
+
     def __init__(self, did: str = None) -> None:
         """
         Initialize the DIDDoc instance.
@@ -90,7 +92,7 @@ class DIDDoc:
     def authnkey(self) -> dict:
         """Accessor for public keys marked as authentication keys, by identifier."""
 
-        return {k: self._pubkey[k] for k in self._pubkey if self._pubkey[k].authn}
+        return {k: pubkey for k, pubkey in self._pubkey.items() if pubkey.authn}
 
     @property
     def service(self) -> dict:
@@ -248,16 +250,16 @@ class DIDDoc:
                 LOGGER.debug("no identifier in DID document")
                 raise ValueError("No identifier in DID document")
 
+        authn_refs = {
+            canon_ref(rv.did, ak["publicKey"])
+            for ak in did_doc.get("authentication", {})
+            if isinstance(ak.get("publicKey", None), str)
+        }
         for pubkey in did_doc.get(
             "publicKey", {}
         ):  # include all public keys, authentication pubkeys by reference
             pubkey_type = PublicKeyType.get(pubkey["type"])
-            authn = any(
-                canon_ref(rv.did, ak.get("publicKey", ""))
-                == canon_ref(rv.did, pubkey["id"])
-                for ak in did_doc.get("authentication", {})
-                if isinstance(ak.get("publicKey", None), str)
-            )
+            authn = canon_ref(rv.did, pubkey["id"]) in authn_refs
             key = PublicKey(  # initialization canonicalizes id
                 rv.did,
                 pubkey["id"],
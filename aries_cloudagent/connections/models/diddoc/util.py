@@ -18,6 +18,8 @@ limitations under the License.
 """
 
 
+from functools import lru_cache
+
 from base58 import b58decode
 from urllib.parse import urlparse
 
@@ -97,6 +99,7 @@ def canon_ref(did: str, ref: str, delimiter: str = None):
     return "did:sov:{}{}{}".format(did, delimiter if delimiter else "#", ref)  # e.g., 3
 
 
+@lru_cache(maxsize=1024)
 def ok_did(token: str) -> bool:
     """
     Whether input token looks like a valid decentralized identifier.
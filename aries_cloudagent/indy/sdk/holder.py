@@ -163,6 +163,24 @@ class IndySdkHolder(IndyHolder):
                         break
             return creds
 
+        async def skip(offset):
+            """Move the search cursor past offset creds, one bounded chunk at a time."""
+            remaining = min(offset, record_count)
+
+            with IndyErrorHandler(
+                "Error fetching credentials from wallet", IndyHolderError
+            ):
+                while remaining > 0:
+                    chunk = min(remaining, IndyHolder.CHUNK)
+                    batch = json.loads(
+                        await indy.anoncreds.prover_fetch_credentials(
+                            search_handle, chunk
+                        )
+                    )
+                    if len(batch) < chunk:
+                        break
+                    remaining -= chunk
+
         with IndyErrorHandler(
             "Error when constructing wallet credential query", IndyHolderError
         ):
@@ -175,7 +193,7 @@ class IndySdkHolder(IndyHolder):
 
             if start > 0:
                 # must move database cursor manually
-                await fetch(start)
+                await skip(start)
             credentials = await fetch(count)
 
             await indy.anoncreds.prover_close_credentials_search(search_handle)
@@ -222,6 +240,25 @@ class IndySdkHolder(IndyHolder):
                         break
             return creds
 
+        async def skip(reft, offset):
+            """Move the search cursor past offset creds, one bounded chunk at a time."""
+            remaining = offset
+
+            with IndyErrorHandler(
+                "Error fetching credentials from wallet for presentation request",
+                IndyHolderError,
+            ):
+                while remaining > 0:
+                    chunk = min(remaining, IndyHolder.CHUNK)
+                    batch = json.loads(
+                        await indy.anoncreds.prover_fetch_credentials_for_proof_req(
+                            search_handle, reft, chunk
+                        )
+                    )
+                    if len(batch) < chunk:
+                        break
+                    remaining -= chunk
+
         with IndyErrorHandler(
             "Error when constructing wallet credential query", IndyHolderError
         ):
@@ -244,7 +281,7 @@ class IndySdkHolder(IndyHolder):
                 for reft in referents:
                     # must move database cursor manually
                     if start > 0:
-                        await fetch(reft, start)
+                        await skip(reft, start)
                     credentials = await fetch(reft, count - len(creds_dict))
 
                     for cred in credentials:
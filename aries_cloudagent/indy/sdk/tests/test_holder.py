@@ -208,6 +208,28 @@ class TestIndySdkHolder(AsyncTestCase):
             (("search_handle", 3),),
         ]
 
+    @async_mock.patch("indy.anoncreds.prover_search_credentials")
+    @async_mock.patch("indy.anoncreds.prover_fetch_credentials")
+    @async_mock.patch("indy.anoncreds.prover_close_credentials_search")
+    async def test_get_credentials_seek_chunked(
+        self, mock_close_cred_search, mock_fetch_credentials, mock_search_credentials
+    ):
+        SKIP = test_module.IndyHolder.CHUNK + 44
+        mock_search_credentials.return_value = ("search_handle", SKIP + 1)
+        mock_fetch_credentials.side_effect = [
+            json.dumps([0] * test_module.IndyHolder.CHUNK),
+            json.dumps([0] * 44),
+            json.dumps([1]),
+        ]
+
+        credentials = await self.holder.get_credentials(SKIP, 1, {})
+        assert mock_fetch_credentials.call_args_list == [
+            (("search_handle", test_module.IndyHolder.CHUNK),),
+            (("search_handle", 44),),
+            (("search_handle", 1),),
+        ]
+        assert credentials == [1]
+
     @async_mock.patch("indy.anoncreds.prover_search_credentials_for_proof_req")
     @async_mock.patch("indy.anoncreds.prover_fetch_credentials_for_proof_req")
     @async_mock.patch("indy.anoncreds.prover_close_credentials_search_for_proof_req")
@@ -12,6 +12,8 @@ from ..wallet.did_info import DIDInfo
 
 from .endpoint_type import EndpointType
 
+DID_PREFIX = re.compile(r"^did:\w+:")
+
 
 class BaseLedger(ABC, metaclass=ABCMeta):
     """Base class for ledger."""
@@ -114,7 +116,7 @@ class BaseLedger(ABC, metaclass=ABCMeta):
     def did_to_nym(self, did: str) -> str:
         """Remove the ledger's DID prefix to produce a nym."""
         if did:
-            return re.sub(r"^did:\w+:", "", did)
+            return DID_PREFIX.sub("", did) if did.startswith("did:") else did
 
     async def get_txn_author_agreement(self, reload: bool = False):
         """Get the current transaction author agreement, fetching it if necessary."""
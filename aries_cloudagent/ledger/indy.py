@@ -666,9 +666,14 @@ class IndySdkLedger(BaseLedger):
             credential_definition_id = issuer.make_credential_definition_id(
                 public_info.did, schema, signature_type, test_tag
             )
-            ledger_cred_def = await self.fetch_credential_definition(
-                credential_definition_id
-            )
+            # ledger and wallet lookups are independent: run them concurrently
+            try:
+                (ledger_cred_def, in_wallet) = await asyncio.gather(
+                    self.fetch_credential_definition(credential_definition_id),
+                    issuer.credential_definition_in_wallet(credential_definition_id),
+                )
+            except IndyIssuerError as err:
+                raise LedgerError(err.message) from err
             if ledger_cred_def:
                 LOGGER.warning(
                     "Credential definition %s already exists on ledger %s",
@@ -676,31 +681,21 @@ class IndySdkLedger(BaseLedger):
                     self.pool.name,
                 )
 
-                try:
-                    if not await issuer.credential_definition_in_wallet(
-                        credential_definition_id
-                    ):
-                        raise LedgerError(
-                            f"Credential definition {credential_definition_id} is on "
-                            f"ledger {self.pool.name} but not in wallet "
-                            f"{self.wallet.opened.name}"
-                        )
-                except IndyIssuerError as err:
-                    raise LedgerError(err.message) from err
+                if not in_wallet:
+                    raise LedgerError(
+                        f"Credential definition {credential_definition_id} is on "
+                        f"ledger {self.pool.name} but not in wallet "
+                        f"{self.wallet.opened.name}"
+                    )
                 credential_definition_json = json.dumps(ledger_cred_def)
                 break
         else:  # no such cred def on ledger
-            try:
-                if await issuer.credential_definition_in_wallet(
-                    credential_definition_id
-                ):
-                    raise LedgerError(
-                        f"Credential definition {credential_definition_id} is in "
-                        f"wallet {self.wallet.opened.name} but not on ledger "
-                        f"{self.pool.name}"
-                    )
-            except IndyIssuerError as err:
-                raise LedgerError(err.message) from err
+            if in_wallet:
+                raise LedgerError(
+                    f"Credential definition {credential_definition_id} is in "
+                    f"wallet {self.wallet.opened.name} but not on ledger "
+                    f"{self.pool.name}"
+                )
 
             # Cred def is neither on ledger nor in wallet: create and send it
             novel = True
@@ -1065,14 +1060,15 @@ class IndySdkLedger(BaseLedger):
         get_aml_req = await indy.ledger.build_get_acceptance_mechanisms_request(
             public_did, None, None
         )
-        response_json = await self._submit(get_aml_req, sign_did=public_info)
-        aml_found = (json.loads(response_json))["result"]["data"]
-
         get_taa_req = await indy.ledger.build_get_txn_author_agreement_request(
             public_did, None
         )
-        response_json = await self._submit(get_taa_req, sign_did=public_info)
-        taa_found = (json.loads(response_json))["result"]["data"]
+        (aml_response_json, taa_response_json) = await asyncio.gather(
+            self._submit(get_aml_req, sign_did=public_info),
+            self._submit(get_taa_req, sign_did=public_info),
+        )
+        aml_found = (json.loads(aml_response_json))["result"]["data"]
+        taa_found = (json.loads(taa_response_json))["result"]["data"]
         taa_required = bool(taa_found and taa_found["text"])
         if taa_found:
             taa_found["digest"] = self.taa_digest(
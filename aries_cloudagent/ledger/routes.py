@@ -22,6 +22,20 @@ from .endpoint_type import EndpointType
 from .error import BadLedgerRequestError, LedgerError, LedgerTransactionError
 
 
+NO_LEDGER_REASON = "No Indy ledger available"
+NO_WALLET_TYPE_HINT = ": missing wallet-type?"
+
+
+def _require_ledger(session, reason: str = NO_LEDGER_REASON) -> BaseLedger:
+    """Return the injected ledger or raise HTTP forbidden if none is available."""
+    ledger = session.inject(BaseLedger, required=False)
+    if not ledger:
+        if not session.settings.get_value("wallet.type"):
+            reason += NO_WALLET_TYPE_HINT
+        raise web.HTTPForbidden(reason=reason)
+    return ledger
+
+
 class LedgerModulesResultSchema(OpenAPISchema):
     """Schema for the modules endpoint."""
 
@@ -170,12 +184,7 @@ async def register_ledger_nym(request: web.BaseRequest):
     """
     context: AdminRequestContext = request["context"]
     session = await context.session()
-    ledger = session.inject(BaseLedger, required=False)
-    if not ledger:
-        reason = "No Indy ledger available"
-        if not session.settings.get_value("wallet.type"):
-            reason += ": missing wallet-type?"
-        raise web.HTTPForbidden(reason=reason)
+    ledger = _require_ledger(session)
 
     did = request.query.get("did")
     verkey = request.query.get("verkey")
@@ -226,12 +235,7 @@ async def get_nym_role(request: web.BaseRequest):
     """
     context: AdminRequestContext = request["context"]
     session = await context.session()
-    ledger = session.inject(BaseLedger, required=False)
-    if not ledger:
-        reason = "No Indy ledger available"
-        if not session.settings.get_value("wallet.type"):
-            reason += ": missing wallet-type?"
-        raise web.HTTPForbidden(reason=reason)
+    ledger = _require_ledger(session)
 
     did = request.query.get("did")
     if not did:
@@ -260,12 +264,7 @@ async def rotate_public_did_keypair(request: web.BaseRequest):
     """
     context: AdminRequestContext = request["context"]
     session = await context.session()
-    ledger = session.inject(BaseLedger, required=False)
-    if not ledger:
-        reason = "No Indy ledger available"
-        if not session.settings.get_value("wallet.type"):
-            reason += ": missing wallet-type?"
-        raise web.HTTPForbidden(reason=reason)
+    ledger = _require_ledger(session)
     async with ledger:
         try:
             await ledger.rotate_public_did_keypair()  # do not take seed over the wire
@@ -290,12 +289,7 @@ async def get_did_verkey(request: web.BaseRequest):
     """
     context: AdminRequestContext = request["context"]
     session = await context.session()
-    ledger = session.inject(BaseLedger, required=False)
-    if not ledger:
-        reason = "No ledger available"
-        if not session.settings.get_value("wallet.type"):
-            reason += ": missing wallet-type?"
-        raise web.HTTPForbidden(reason=reason)
+    ledger = _require_ledger(session, "No ledger available")
 
     did = request.query.get("did")
     if not did:
@@ -327,12 +321,7 @@ async def get_did_endpoint(request: web.BaseRequest):
     """
     context: AdminRequestContext = request["context"]
     session = await context.session()
-    ledger = session.inject(BaseLedger, required=False)
-    if not ledger:
-        reason = "No Indy ledger available"
-        if not session.settings.get_value("wallet.type"):
-            reason += ": missing wallet-type?"
-        raise web.HTTPForbidden(reason=reason)
+    ledger = _require_ledger(session)
 
     did = request.query.get("did")
     endpoint_type = EndpointType.get(
@@ -366,12 +355,7 @@ async def ledger_get_taa(request: web.BaseRequest):
     """
     context: AdminRequestContext = request["context"]
     session = await context.session()
-    ledger = session.inject(BaseLedger, required=False)
-    if not ledger:
-        reason = "No Indy ledger available"
-        if not session.settings.get_value("wallet.type"):
-            reason += ": missing wallet-type?"
-        raise web.HTTPForbidden(reason=reason)
+    ledger = _require_ledger(session)
 
     async with ledger:
         try:
@@ -407,12 +391,7 @@ async def ledger_accept_taa(request: web.BaseRequest):
     """
     context: AdminRequestContext = request["context"]
     session = await context.session()
-    ledger = session.inject(BaseLedger, required=False)
-    if not ledger:
-        reason = "No Indy ledger available"
-        if not session.settings.get_value("wallet.type"):
-            reason += ": missing wallet-type?"
-        raise web.HTTPForbidden(reason=reason)
+    ledger = _require_ledger(session)
 
     accept_input = await request.json()
     async with ledger:
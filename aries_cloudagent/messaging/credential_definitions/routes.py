@@ -2,7 +2,7 @@
 
 import json
 
-from asyncio import ensure_future, shield
+from asyncio import ensure_future, gather, shield
 
 from aiohttp import web
 from aiohttp_apispec import (
@@ -196,13 +196,14 @@ async def credential_definitions_send_credential_definition(request: web.BaseReq
                 connection_record = await ConnRecord.retrieve_by_id(
                     session, connection_id
                 )
+                endorser_info = await connection_record.metadata_get(
+                    session, "endorser_info"
+                )
         except StorageNotFoundError as err:
             raise web.HTTPNotFound(reason=err.roll_up) from err
         except BaseModelError as err:
             raise web.HTTPBadRequest(reason=err.roll_up) from err
 
-        session = await context.session()
-        endorser_info = await connection_record.metadata_get(session, "endorser_info")
         if not endorser_info:
             raise web.HTTPForbidden(
                 reason="Endorser Info is not set up in "
@@ -262,7 +263,20 @@ async def credential_definitions_send_credential_definition(request: web.BaseReq
                 profile, f"{tails_base_url}/{registry_record.revoc_reg_id}"
             )
             await registry_record.send_def(profile)
-            await registry_record.send_entry(profile)
+
+            # ledger entry and tails upload are independent once the def is sent
+            tails_server = profile.inject(BaseTailsServer)
+            (_, (upload_success, reason)) = await gather(
+                registry_record.send_entry(profile),
+                tails_server.upload_tails_file(
+                    profile,
+                    registry_record.revoc_reg_id,
+                    registry_record.tails_local_path,
+                    interval=0.8,
+                    backoff=-0.5,
+                    max_attempts=5,  # heuristic: respect HTTP timeout
+                ),
+            )
 
             # stage pending registry independent of whether tails server is OK
             pending_registry_record = await revoc.init_issuer_registry(
@@ -273,15 +287,6 @@ async def credential_definitions_send_credential_definition(request: web.BaseReq
                 pending_registry_record.stage_pending_registry(profile, max_attempts=16)
             )
 
-            tails_server = profile.inject(BaseTailsServer)
-            (upload_success, reason) = await tails_server.upload_tails_file(
-                profile,
-                registry_record.revoc_reg_id,
-                registry_record.tails_local_path,
-                interval=0.8,
-                backoff=-0.5,
-                max_attempts=5,  # heuristic: respect HTTP timeout
-            )
             if not upload_success:
                 raise web.HTTPInternalServerError(
                     reason=(
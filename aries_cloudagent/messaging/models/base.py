@@ -1,6 +1,7 @@
 """Base classes for Models and Schemas."""
 import logging
 from abc import ABC
+from functools import lru_cache
 import json
 from typing import Union
 
@@ -12,6 +13,12 @@ from ...utils.classloader import ClassLoader
 LOGGER = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=None)
+def _load_class(class_name: str, default_module: str = None) -> type:
+    """Load a class by name, memoizing the result for repeat lookups."""
+    return ClassLoader.load_class(class_name, default_module)
+
+
 def resolve_class(the_cls, relative_cls: type = None):
     """
     Resolve a class.
@@ -32,7 +39,7 @@ def resolve_class(the_cls, relative_cls: type = None):
         resolved = the_cls
     elif isinstance(the_cls, str):
         default_module = relative_cls and relative_cls.__module__
-        resolved = ClassLoader.load_class(the_cls, default_module)
+        resolved = _load_class(the_cls, default_module)
     return resolved
 
 
@@ -68,6 +75,8 @@ class BaseModelError(BaseError):
 class BaseModel(ABC):
     """Base model that provides convenience methods."""
 
+    __slots__ = ()
+
     class Meta:
         """BaseModel meta data."""
 
@@ -207,10 +216,13 @@ class BaseModel(ABC):
 
         """
         exclude = resolve_meta_property(self, "repr_exclude", [])
+        attrs = dict(getattr(self, "__dict__", {}))
+        for cls in type(self).__mro__:
+            for k in cls.__dict__.get("__slots__", ()):
+                if hasattr(self, k):
+                    attrs.setdefault(k, getattr(self, k))
         items = (
-            "{}={}".format(k, repr(v))
-            for k, v in self.__dict__.items()
-            if k not in exclude
+            "{}={}".format(k, repr(v)) for k, v in attrs.items() if k not in exclude
         )
         return "<{}({})>".format(self.__class__.__name__, ", ".join(items))
 
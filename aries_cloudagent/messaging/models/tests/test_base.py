@@ -11,6 +11,7 @@ from ....storage.base import BaseStorage, StorageRecord
 from ...responder import BaseResponder, MockResponder
 from ...util import time_now
 
+from .. import base as test_module
 from ..base import BaseModel, BaseModelError, BaseModelSchema
 
 
@@ -46,6 +47,17 @@ class TestBase(AsyncTestCase):
         model = model.validate()
         assert model.attr == "succeeds"
 
+    def test_schema_class_resolved_once(self):
+        with async_mock.patch.object(
+            test_module.ClassLoader, "load_class", async_mock.MagicMock()
+        ) as mock_load_class:
+            test_module._load_class.cache_clear()
+            mock_load_class.return_value = SchemaImpl
+            assert ModelImpl._get_schema_class() is SchemaImpl
+            assert ModelImpl._get_schema_class() is SchemaImpl
+            mock_load_class.assert_called_once_with("SchemaImpl", __name__)
+        test_module._load_class.cache_clear()
+
     def test_ser_x(self):
         model = ModelImpl(attr="hello world")
         with async_mock.patch.object(
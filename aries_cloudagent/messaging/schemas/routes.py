@@ -184,13 +184,14 @@ async def schemas_send_schema(request: web.BaseRequest):
                 connection_record = await ConnRecord.retrieve_by_id(
                     session, connection_id
                 )
+                endorser_info = await connection_record.metadata_get(
+                    session, "endorser_info"
+                )
         except StorageNotFoundError as err:
             raise web.HTTPNotFound(reason=err.roll_up) from err
         except BaseModelError as err:
             raise web.HTTPBadRequest(reason=err.roll_up) from err
 
-        session = await context.session()
-        endorser_info = await connection_record.metadata_get(session, "endorser_info")
         if not endorser_info:
             raise web.HTTPForbidden(
                 reason="Endorser Info is not set up in "
@@ -126,7 +126,7 @@ class MultitenantManager:
         self,
         base_context: InjectionContext,
         wallet_record: WalletRecord,
-        extra_settings: dict = {},
+        extra_settings: dict = None,
         *,
         provision=False,
     ) -> Profile:
@@ -158,14 +158,15 @@ class MultitenantManager:
                 "mediation.default_id": None,
                 "mediation.clear": None,
             }
-            extra_settings["admin.webhook_urls"] = self.get_webhook_urls(
-                base_context, wallet_record
-            )
-
-            context.settings = (
-                context.settings.extend(reset_settings)
-                .extend(wallet_record.settings)
-                .extend(extra_settings)
+            context.settings = context.settings.extend(
+                {
+                    **reset_settings,
+                    **wallet_record.settings,
+                    **(extra_settings or {}),
+                    "admin.webhook_urls": self.get_webhook_urls(
+                        base_context, wallet_record
+                    ),
+                }
             )
 
             # MTODO: add ledger config
@@ -162,6 +162,30 @@ class TestMultitenantManager(AsyncTestCase):
                 )
                 assert profile.settings.get("extra_settings") == "extra_settings"
 
+    async def test_get_wallet_profile_extra_settings_not_mutated(self):
+        extra_settings = {"extra_settings": "extra_settings"}
+        wallet_record = WalletRecord(
+            wallet_id="test",
+            settings={
+                "wallet.dispatch_type": "default",
+                "wallet.webhook_urls": ["https://localhost:8090"],
+            },
+        )
+
+        def side_effect(context, provision):
+            return (InMemoryProfile(context=context), None)
+
+        with async_mock.patch(
+            "aries_cloudagent.multitenant.manager.wallet_config"
+        ) as wallet_config:
+            wallet_config.side_effect = side_effect
+            profile = await self.manager.get_wallet_profile(
+                self.profile.context, wallet_record, extra_settings
+            )
+
+        assert profile.settings.get("admin.webhook_urls") == ["https://localhost:8090"]
+        assert extra_settings == {"extra_settings": "extra_settings"}
+
     async def test_get_wallet_profile_settings_reset(self):
         wallet_record = WalletRecord(
             wallet_id="test",
@@ -2,12 +2,14 @@
 import re
 
 from enum import Enum
+from functools import lru_cache
 from os import environ
 from typing import Mapping
 
 QUALIFIED = re.compile(r"^[a-zA-Z\-\+]+:.+")
 
 
+@lru_cache(maxsize=1024)
 def qualify(msg_type: str, prefix: str):
     """Qualify a message type with a prefix, if unqualified."""
 
@@ -1,5 +1,7 @@
 """LDProofVCDetailOptions."""
 
+import sys
+
 from typing import Optional
 from marshmallow import fields, Schema, INCLUDE
 
@@ -10,6 +12,15 @@ from .......messaging.valid import INDY_ISO8601_DATETIME, UUIDFour
 class LDProofVCDetailOptions(BaseModel):
     """Linked Data Proof verifiable credential options model."""
 
+    __slots__ = (
+        "proof_type",
+        "proof_purpose",
+        "created",
+        "domain",
+        "challenge",
+        "credential_status",
+    )
+
     class Meta:
         """LDProofVCDetailOptions metadata."""
 
@@ -26,24 +37,32 @@ class LDProofVCDetailOptions(BaseModel):
     ) -> None:
         """Initialize the LDProofVCDetailOptions instance."""
 
-        self.proof_type = proof_type
-        self.proof_purpose = proof_purpose
+        self.proof_type = sys.intern(proof_type) if proof_type else proof_type
+        self.proof_purpose = (
+            sys.intern(proof_purpose) if proof_purpose else proof_purpose
+        )
         self.created = created
         self.domain = domain
         self.challenge = challenge
         self.credential_status = credential_status
 
+    def _key(self) -> tuple:
+        """Return the fields that determine equality."""
+        return (
+            self.proof_type,
+            self.proof_purpose,
+            self.created,
+            self.domain,
+            self.challenge,
+            self.credential_status,
+        )
+
     def __eq__(self, o: object) -> bool:
         """Check equalness."""
+        if self is o:
+            return True
         if isinstance(o, LDProofVCDetailOptions):
-            return (
-                self.proof_type == o.proof_type
-                and self.proof_purpose == o.proof_purpose
-                and self.created == o.created
-                and self.domain == o.domain
-                and self.challenge == o.challenge
-                and self.credential_status == o.credential_status
-            )
+            return self._key() == o._key()
 
         return False
 
@@ -67,3 +67,19 @@ class TestLDProofVCDetailOptions(TestCase):
 
         detail_options_dict = detail_options.serialize()
         assert detail_options_dict == VC_DETAIL_OPTIONS
+
+    def test_eq(self):
+        """Test equality."""
+        detail_options = LDProofVCDetailOptions.deserialize(VC_DETAIL_OPTIONS)
+        assert detail_options == detail_options
+        assert detail_options == LDProofVCDetailOptions.deserialize(VC_DETAIL_OPTIONS)
+        assert detail_options != LDProofVCDetailOptions.deserialize(
+            {**VC_DETAIL_OPTIONS, "domain": "example.org"}
+        )
+        assert detail_options != VC_DETAIL_OPTIONS
+
+    def test_slots(self):
+        """Test options carry no instance dict."""
+        detail_options = LDProofVCDetailOptions.deserialize(VC_DETAIL_OPTIONS)
+        assert not hasattr(detail_options, "__dict__")
+        assert "domain='example.com'" in repr(detail_options)
@@ -1,5 +1,7 @@
 """Utilities to deal with indy."""
 
+import re
+
 from marshmallow import fields, validate, validates_schema, ValidationError
 
 from ....messaging.models.openapi import OpenAPISchema
@@ -12,6 +14,16 @@ from ....messaging.valid import (
     INT_EPOCH,
 )
 
+RESTRICTION_KEY = re.compile(
+    "^(schema_id|"
+    "schema_issuer_did|"
+    "schema_name|"
+    "schema_version|"
+    "issuer_did|"
+    "cred_def_id|"
+    "attr::.+::value)$"  # indy does not support attr::...::marker here
+)
+
 
 class IndyProofReqPredSpecRestrictionsSchema(OpenAPISchema):
     """Schema for restrictions in attr or pred specifier indy proof request."""
@@ -63,15 +75,7 @@ class IndyProofReqAttrSpecSchema(OpenAPISchema):
     restrictions = fields.List(
         fields.Dict(
             keys=fields.Str(
-                validate=validate.Regexp(
-                    "^schema_id|"
-                    "schema_issuer_did|"
-                    "schema_name|"
-                    "schema_version|"
-                    "issuer_did|"
-                    "cred_def_id|"
-                    "attr::.+::value$"  # indy does not support attr::...::marker here
-                ),
+                validate=validate.Regexp(RESTRICTION_KEY),
                 example="cred_def_id",  # marshmallow/apispec v3.0 ignores
             ),
             values=fields.Str(example=INDY_CRED_DEF_ID["example"]),
@@ -105,12 +109,12 @@ class IndyProofReqAttrSpecSchema(OpenAPISchema):
             ValidationError: if data has both or neither of name and names
 
         """
-        if ("name" in data) == ("names" in data):
+        has_names = "names" in data
+        if ("name" in data) == has_names:
             raise ValidationError(
                 "Attribute specification must have either name or names but not both"
             )
-        restrictions = data.get("restrictions")
-        if ("names" in data) and (not restrictions or all(not r for r in restrictions)):
+        if has_names and not any(data.get("restrictions") or ()):
             raise ValidationError(
                 "Attribute specification on 'names' must have non-empty restrictions"
             )
@@ -0,0 +1,26 @@
+from unittest import TestCase
+
+from marshmallow import ValidationError
+
+from ..proof_request import IndyProofReqAttrSpecSchema
+
+
+class TestIndyProofReqAttrSpecSchema(TestCase):
+    """Indy proof request attribute specification tests."""
+
+    def test_restriction_keys(self):
+        schema = IndyProofReqAttrSpecSchema()
+        for key in (
+            "schema_id",
+            "schema_issuer_did",
+            "schema_name",
+            "schema_version",
+            "issuer_did",
+            "cred_def_id",
+            "attr::favouriteDrink::value",
+        ):
+            schema.load({"name": "favouriteDrink", "restrictions": [{key: "x"}]})
+
+        for key in ("schema_name_x", "x_cred_def_id", "attr::favouriteDrink::marker"):
+            with self.assertRaises(ValidationError):
+                schema.load({"name": "favouriteDrink", "restrictions": [{key: "x"}]})
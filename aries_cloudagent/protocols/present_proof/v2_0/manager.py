@@ -503,11 +503,12 @@ class V20PresManager:
                 sub_proof_index = attr_spec["sub_proof_index"]
                 schema_id = proof["identifiers"][sub_proof_index]["schema_id"]
                 cred_def_id = proof["identifiers"][sub_proof_index]["cred_def_id"]
+                schema_id_parts = schema_id.split(":")
                 criteria = {
                     "schema_id": schema_id,
-                    "schema_issuer_did": schema_id.split(":")[-4],
-                    "schema_name": schema_id.split(":")[-2],
-                    "schema_version": schema_id.split(":")[-1],
+                    "schema_issuer_did": schema_id_parts[-4],
+                    "schema_name": schema_id_parts[-2],
+                    "schema_version": schema_id_parts[-1],
                     "cred_def_id": cred_def_id,
                     "issuer_did": cred_def_id.split(":")[-5],
                     f"attr::{name}::value": proof_value,
@@ -535,11 +536,12 @@ class V20PresManager:
                 sub_proof_index = attr_spec["sub_proof_index"]
                 schema_id = proof["identifiers"][sub_proof_index]["schema_id"]
                 cred_def_id = proof["identifiers"][sub_proof_index]["cred_def_id"]
+                schema_id_parts = schema_id.split(":")
                 criteria = {
                     "schema_id": schema_id,
-                    "schema_issuer_did": schema_id.split(":")[-4],
-                    "schema_name": schema_id.split(":")[-2],
-                    "schema_version": schema_id.split(":")[-1],
+                    "schema_issuer_did": schema_id_parts[-4],
+                    "schema_name": schema_id_parts[-2],
+                    "schema_version": schema_id_parts[-1],
                     "cred_def_id": cred_def_id,
                     "issuer_did": cred_def_id.split(":")[-5],
                     **{
@@ -588,11 +590,12 @@ class V20PresManager:
 
                 schema_id = proof["identifiers"][sub_proof_index]["schema_id"]
                 cred_def_id = proof["identifiers"][sub_proof_index]["cred_def_id"]
+                schema_id_parts = schema_id.split(":")
                 criteria = {
                     "schema_id": schema_id,
-                    "schema_issuer_did": schema_id.split(":")[-4],
-                    "schema_name": schema_id.split(":")[-2],
-                    "schema_version": schema_id.split(":")[-1],
+                    "schema_issuer_did": schema_id_parts[-4],
+                    "schema_name": schema_id_parts[-2],
+                    "schema_version": schema_id_parts[-1],
                     "cred_def_id": cred_def_id,
                     "issuer_did": cred_def_id.split(":")[-5],
                 }
@@ -2,7 +2,7 @@ from os import environ
 
 from asynctest import TestCase as AsyncTestCase
 
-from ..didcomm_prefix import DIDCommPrefix
+from ..didcomm_prefix import DIDCommPrefix, qualify
 
 
 class TestDIDCommPrefix(AsyncTestCase):
@@ -45,3 +45,14 @@ class TestDIDCommPrefix(AsyncTestCase):
             DIDCommPrefix.NEW.qualify(mtype): mcls,
             DIDCommPrefix.OLD.qualify(mtype): mcls,
         }
+
+    def test_qualify_tracks_current_prefix(self):
+        DIDCommPrefix.set({"emit_new_didcomm_prefix": True})
+        assert DIDCommPrefix.qualify_current("hello") == (
+            f"{DIDCommPrefix.NEW.value}/hello"
+        )
+        DIDCommPrefix.set({"emit_new_didcomm_prefix": False})
+        assert DIDCommPrefix.qualify_current("hello") == (
+            f"{DIDCommPrefix.OLD.value}/hello"
+        )
+        assert qualify.cache_info().currsize > 0
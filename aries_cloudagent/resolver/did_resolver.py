@@ -11,6 +11,7 @@ from typing import Union
 
 from pydid import DID, DIDDocument, DIDError, DIDUrl, Service, VerificationMethod
 
+from ..cache.base import BaseCache
 from ..core.profile import Profile
 
 from .base import (
@@ -27,20 +28,37 @@ LOGGER = logging.getLogger(__name__)
 class DIDResolver:
     """did resolver singleton."""
 
-    def __init__(self, registry: DIDResolverRegistry):
-        """Initialize a `didresolver` instance."""
+    def __init__(self, registry: DIDResolverRegistry, cache_ttl: int = 300):
+        """Initialize a `didresolver` instance.
+
+        Args:
+            registry: The registry of DID resolvers
+            cache_ttl: TTL in seconds for cached DID documents
+
+        """
         self.did_resolver_registry = registry
+        self.cache_ttl = cache_ttl
 
     async def resolve(self, profile: Profile, did: Union[str, DID]) -> DIDDocument:
-        """Retrieve did doc from public registry."""
-        # TODO Cache results
+        """Retrieve did doc from the cache if available, otherwise public registry."""
         py_did = DID(did) if isinstance(did, str) else did
+        cache_key = f"did_resolver::{py_did}"
+        cache = profile.inject(BaseCache, required=False)
+        if cache:
+            cached = await cache.get(cache_key)
+            if cached:
+                return DIDDocument.deserialize(cached)
+
         for resolver in self._match_did_to_resolver(py_did):
             try:
                 LOGGER.debug("Resolving DID %s with %s", did, resolver)
-                return await resolver.resolve(profile, py_did)
+                did_doc = await resolver.resolve(profile, py_did)
             except DIDNotFound:
                 LOGGER.debug("DID %s not found by resolver %s", did, resolver)
+            else:
+                if cache:
+                    await cache.set(cache_key, did_doc.serialize(), self.cache_ttl)
+                return did_doc
 
         raise DIDNotFound(f"DID {did} could not be resolved")
 
@@ -69,7 +87,6 @@ class DIDResolver:
         self, profile: Profile, did_url: str
     ) -> Union[Service, VerificationMethod]:
         """Dereference a DID URL to its corresponding DID Doc object."""
-        # TODO Use cached DID Docs when possible
         try:
             did_url = DIDUrl.parse(did_url)
             doc = await self.resolve(profile, did_url.did)
@@ -6,6 +6,9 @@ import unittest
 from asynctest import mock as async_mock
 from pydid import DID, DIDDocument, DIDError, VerificationMethod
 
+from ...cache.base import BaseCache
+from ...cache.in_memory import InMemoryCache
+from ...core.in_memory import InMemoryProfile
 from ..base import (
     BaseDIDResolver,
     DIDMethodNotSupported,
@@ -91,7 +94,7 @@ def resolver():
 
 @pytest.fixture
 def profile():
-    yield async_mock.MagicMock()
+    yield InMemoryProfile.test_profile()
 
 
 def test_create_resolver(resolver):
@@ -181,3 +184,21 @@ async def test_resolve_did_x_not_found(profile):
     resolver = DIDResolver(registry)
     with pytest.raises(DIDNotFound):
         await resolver.resolve(profile, py_did)
+
+
+@pytest.mark.asyncio
+async def test_resolve_cached(profile):
+    cache = InMemoryCache()
+    profile.context.injector.bind_instance(BaseCache, cache)
+    mock_resolver = MockResolver(["example"], DIDDocument.deserialize(DOC))
+    registry = DIDResolverRegistry()
+    registry.register(mock_resolver)
+    resolver = DIDResolver(registry)
+    with async_mock.patch.object(
+        mock_resolver, "_resolve", async_mock.CoroutineMock(return_value=DOC)
+    ) as mock_resolve:
+        did_doc = await resolver.resolve(profile, DOC["id"])
+        cached_doc = await resolver.resolve(profile, DOC["id"])
+        mock_resolve.assert_called_once()
+    assert cached_doc.serialize() == did_doc.serialize()
+    assert await cache.get(f"did_resolver::{DOC['id']}")
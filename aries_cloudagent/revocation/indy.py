@@ -46,7 +46,7 @@ class IndyRevocation:
 
         record = IssuerRevRegRecord(
             cred_def_id=cred_def_id,
-            issuer_did=cred_def_id.split(":")[0],
+            issuer_did=cred_def_id.partition(":")[0],
             max_cred_num=max_cred_num,
             revoc_def_type=revoc_def_type,
             tag=tag,
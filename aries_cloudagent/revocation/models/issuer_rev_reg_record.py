@@ -9,7 +9,7 @@ from functools import total_ordering
 from os.path import join
 from shutil import move
 from typing import Any, Sequence
-from urllib.parse import urlparse
+from urllib.parse import urlsplit
 
 from marshmallow import fields, validate
 
@@ -129,7 +129,7 @@ class IssuerRevRegRecord(BaseRecord):
         }
 
     def _check_url(self, url) -> None:
-        parsed = urlparse(url)
+        parsed = urlsplit(url)
         if not (parsed.scheme and parsed.netloc and parsed.path):
             raise RevocationError("URI {} is not a valid URL".format(url))
 
@@ -21,9 +21,7 @@ class DIDPosture(Enum):
             return None
 
         elif isinstance(posture, str):
-            for did_posture in DIDPosture:
-                if posture.lower() == did_posture.value.moniker:
-                    return did_posture
+            return _POSTURE_BY_MONIKER.get(posture.lower())
 
         elif posture.get("public"):
             return DIDPosture.PUBLIC
@@ -48,3 +46,6 @@ class DIDPosture(Enum):
     def ordinal(self) -> Mapping:
         """Ordinal for presentation: public first, then posted and wallet-only."""
         return self.value.ordinal
+
+
+_POSTURE_BY_MONIKER = {did_posture.moniker: did_posture for did_posture in DIDPosture}
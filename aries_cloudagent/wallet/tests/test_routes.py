@@ -169,6 +169,8 @@ class TestWalletRoutes(AsyncTestCase):
             )
             assert json_response.return_value is json_response()
             assert result is json_response.return_value
+            self.wallet.get_public_did.assert_not_called()
+            self.wallet.get_posted_dids.assert_not_called()
 
     async def test_did_list_filter_public(self):
         self.request.query = {"posture": DIDPosture.PUBLIC.moniker}